@@ -5,34 +5,39 @@ Video Downloader
 Downloads videos from YouTube, Bilibili and other platforms with customizable quality and format options.
 """
 
+# Heavier modules (asyncio, subprocess, json, ...) are imported inside the
+# functions that need them to keep start-up (e.g. --help) fast
 import argparse
 import sys
-import subprocess
-import json
 import os
-import re
+import time
 from pathlib import Path
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse
 
-# Set UTF-8 encoding for Windows console
-if sys.platform == "win32":
-    # Ensure stdout/stderr use UTF-8 where possible without detaching
-    if hasattr(sys.stdout, 'reconfigure'):
-        sys.stdout.reconfigure(encoding='utf-8')
-    if hasattr(sys.stderr, 'reconfigure'):
-        sys.stderr.reconfigure(encoding='utf-8')
+# Use UTF-8 for the console (Windows, C/POSIX locales) and replace anything
+# that still cannot be encoded instead of raising UnicodeEncodeError
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+if hasattr(sys.stderr, 'reconfigure'):
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
+# Set once yt-dlp is known to be importable, so batch and concurrent
+# downloads only run the check a single time per process
+_yt_dlp_checked = False
 
-def safe_print(text):
-    """Print text safely, handling encoding errors."""
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        try:
-            print(text.encode('utf-8', errors='ignore').decode('utf-8'))
-        except Exception:
-            safe_text = text.encode('ascii', 'ignore').decode('ascii')
-            print(safe_text)
+# Set once ~/.local/bin has been put on PATH
+_path_fixed = False
+
+# orjson module once looked up, False if it is not installed
+_orjson = None
+
+# Extracted video info is kept for a while so the download (or a retry)
+# can reuse it instead of running the extractor again
+CACHE_DIR = Path.home() / ".cache" / "video-downloader-skill"
+INFO_CACHE_TTL = 3600  # seconds
+
+# Where --daemon listens and --client connects by default
+DAEMON_SOCKET = CACHE_DIR / "daemon.sock"
 
 
 def is_bilibili_url(url):
@@ -40,52 +45,72 @@ def is_bilibili_url(url):
     if not url:
         return False
     try:
-        parsed_url = urlparse(url)
-        bilibili_pattern = r'(.*\.)?bilibili\.com$'
-        return bool(re.search(bilibili_pattern, parsed_url.netloc))
+        host = urlparse(url).hostname or ''
     except Exception:
         return False
+    # bilibili.com itself or any of its subdomains
+    return host == 'bilibili.com' or host.endswith('.bilibili.com')
 
 
-def format_bilibili_url(url):
+def format_bilibili_url(url, is_bilibili=None):
     """
     Clean Bilibili URL by keeping only essential parameters.
+    Pass is_bilibili if the caller has already checked the URL.
     """
-    if not is_bilibili_url(url):
+    if is_bilibili is None:
+        is_bilibili = is_bilibili_url(url)
+    if not is_bilibili:
         return url
     
-    try:
-        parsed = urlparse(url)
-        query_params = parse_qs(parsed.query)
-        
-        # Construct base URL (without query params)
-        base_path = parsed.path.rstrip('/')
-        formatted_url = f"{parsed.scheme}://{parsed.netloc}{base_path}"
-        
-        # Keep 'p' parameter if present
-        if 'p' in query_params:
-            pid = query_params['p'][0]
-            formatted_url += f"?p={pid}"
-            
-        return formatted_url
-    except Exception:
-        return url
+    # Split off the fragment and query by hand, only 'p' is needed
+    url = url.partition('#')[0]
+    base, _, query = url.partition('?')
+    
+    # Construct base URL (without query params)
+    base = base.rstrip('/')
+    
+    # Keep 'p' parameter if present
+    for param in query.split('&'):
+        if param.startswith('p=') and len(param) > 2:
+            return f"{base}?{param}"
+    
+    return base
 
 
-def check_yt_dlp():
-    """Check if yt-dlp is installed, install if not."""
-    # Add user's local bin to PATH
+def _ensure_local_bin_on_path():
+    """Add the user's local bin (where pip --user installs scripts) to PATH, once per process."""
+    global _path_fixed
+    if _path_fixed:
+        return
+    _path_fixed = True
+    
     local_bin = str(Path.home() / ".local" / "bin")
-    if local_bin not in os.environ.get("PATH", ""):
-        os.environ["PATH"] = f"{local_bin}:{os.environ.get('PATH', '')}"
+    path = os.environ.get("PATH", "")
+    if local_bin not in path.split(os.pathsep):
+        os.environ["PATH"] = f"{local_bin}{os.pathsep}{path}" if path else local_bin
+
+
+def check_yt_dlp():
+    """Check if the yt-dlp module is importable, install it if not."""
+    global _yt_dlp_checked
+    if _yt_dlp_checked:
+        return
     
-    try:
-        subprocess.run(["yt-dlp", "--version"], capture_output=True, check=True)
+    import importlib
+    import importlib.util
+    
+    _ensure_local_bin_on_path()
+    
+    # Only look the package up here; importing it is left to the code that
+    # actually uses it
+    if importlib.util.find_spec("yt_dlp") is not None:
+        _yt_dlp_checked = True
         return
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
     
-    safe_print("yt-dlp not found. Installing...")
+    import site
+    import subprocess
+    
+    print("yt-dlp not found. Installing...")
     try:
         # Try with --break-system-packages first (for newer pip versions)
         result = subprocess.run(
@@ -98,60 +123,185 @@ def check_yt_dlp():
         # Fall back to regular install if --break-system-packages is not supported
         subprocess.run([sys.executable, "-m", "pip", "install", "--user", "yt-dlp"], check=True)
     
-    safe_print("yt-dlp installed successfully!")
+    # A --user install may have created the user site-packages directory
+    # after startup, so make it importable in this process
+    site.addsitedir(site.getusersitepackages())
+    importlib.invalidate_caches()
+    _yt_dlp_checked = True
+    
+    print("yt-dlp installed successfully!")
+
+
+def _extractor_options(is_bilibili):
+    """Options that affect extraction, shared by info lookups and downloads."""
+    ydl_opts = {'noplaylist': True}  # Don't download playlists by default
+    
+    if is_bilibili:
+        # Add required headers for Bilibili
+        ydl_opts['http_headers'] = {
+            'Referer': 'https://www.bilibili.com/',
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        }
+        
+        # Force HTML5 mode to handle WBI signature
+        ydl_opts['extractor_args'] = {'bilibili': {'videomode': ['html5']}}
+    
+    return ydl_opts
+
+
+def _info_cache_path(url, ydl_opts):
+    """Return the path of the cached info JSON for a URL extracted with ydl_opts."""
+    import hashlib
+    import json
+    
+    # Info extracted with other headers or extractor arguments is not
+    # interchangeable, so those options are part of the key
+    key = json.dumps(
+        [url] + [ydl_opts.get(name) for name in ('noplaylist', 'http_headers', 'extractor_args')],
+        sort_keys=True
+    )
+    return CACHE_DIR / "info" / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+
+def _fresh_info_cache(url, ydl_opts):
+    """Return the cached info JSON path for a URL if it is still fresh, else None."""
+    path = _info_cache_path(url, ydl_opts)
+    try:
+        if time.time() - path.stat().st_mtime < INFO_CACHE_TTL:
+            return path
+    except OSError:
+        pass
+    return None
+
+
+def _get_orjson():
+    """Return the orjson module, or None if it is not installed."""
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = False
+    return _orjson or None
+
+
+def _json_loads(data):
+    """Parse JSON bytes, using orjson when it is installed."""
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """Serialize to JSON bytes, using orjson when it is installed."""
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.dumps(obj)
+    import json
+    return json.dumps(obj).encode('utf-8')
+
+
+def _prune_info_cache():
+    """Delete cached info (and stray temporary files) older than INFO_CACHE_TTL."""
+    now = time.time()
+    try:
+        entries = list(os.scandir(CACHE_DIR / "info"))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if now - entry.stat().st_mtime >= INFO_CACHE_TTL:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+def _write_info_cache(url, ydl_opts, info):
+    """Store sanitized info for a URL; returns the cache path, or None if it was not written."""
+    import threading
+    
+    # Only single videos can be replayed: download_with_info_file drops the
+    # entries of playlists and feeds
+    if info.get('_type', 'video') != 'video':
+        return None
+    
+    # Entries are only useful within the TTL, so drop expired ones here to
+    # keep the directory from growing without bound
+    _prune_info_cache()
+    
+    # Write to a temporary file first so concurrent readers never see a partial file
+    path = _info_cache_path(url, ydl_opts)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(_json_dumps(info))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError):
+        return None
+    return path
 
 
 def get_video_info(url):
     """Get information about the video without downloading."""
+    # Extract the same way the download does, so the cached info can be reused by it
+    ydl_opts = _extractor_options(is_bilibili_url(url))
+    
+    cached = _fresh_info_cache(url, ydl_opts)
+    if cached:
+        try:
+            return _json_loads(cached.read_bytes())
+        except (OSError, ValueError):
+            pass
+    
     try:
-        # Use a simpler call for info extraction
-        result = subprocess.run(
-            ["yt-dlp", "--dump-json", "--no-playlist", url],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace'
-        )
-        if result.returncode == 0:
-            return json.loads(result.stdout)
-        return None
+        from yt_dlp import YoutubeDL
+        
+        info_opts = {
+            **ydl_opts,
+            'quiet': True,
+            'no_warnings': True,
+            'skip_download': True,
+        }
+        with YoutubeDL(info_opts) as ydl:
+            info = ydl.sanitize_info(ydl.extract_info(url, download=False))
     except Exception:
         return None
+    
+    _write_info_cache(url, ydl_opts, info)
+    return info
 
 
-def download_video_internal(url, output_path, quality, format_type, audio_only, is_retry=False):
+def download_video_internal(urls, output_path, quality, format_type, audio_only, is_retry=False,
+                            concurrent_fragments=4, is_bilibili=None, use_aria2c=True):
     """
-    Internal function to download video with specific URL.
+    Internal function to download one or more videos with a single YoutubeDL instance.
     Returns (success, error_message)
     """
-    # Check platform type
-    is_bilibili = is_bilibili_url(url)
+    import shutil
+    from yt_dlp import YoutubeDL
     
-    # Build command
-    cmd = ["yt-dlp"]
+    # Check platform type, unless the caller already did
+    if is_bilibili is None:
+        is_bilibili = any(is_bilibili_url(url) for url in urls)
     
-    # --- Bilibili-specific optimizations ---
-    if is_bilibili:
-        if not is_retry:
-            safe_print("[Bilibili detected] Using optimized download strategy...")
-        
-        # Add required headers for Bilibili
-        cmd.extend([
-            "--add-header", "Referer:https://www.bilibili.com/",
-            "--add-header", "User-Agent:Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ])
-        
-        # Force HTML5 mode to handle WBI signature
-        cmd.extend(["--extractor-args", "bilibili:videomode=html5"])
-
-    # ----------------------------------------
+    # Build options, starting from the extraction ones (Bilibili headers and
+    # HTML5 mode to handle the WBI signature and 412 responses)
+    extract_opts = _extractor_options(is_bilibili)
+    ydl_opts = dict(extract_opts)
+    
+    if is_bilibili and not is_retry:
+        print("[Bilibili detected] Using optimized download strategy...")
     
     if audio_only:
-        cmd.extend([
-            "-x",  # Extract audio
-            "--audio-format", "mp3",
-            "--audio-quality", "0",  # Best quality
-        ])
+        ydl_opts['format'] = 'bestaudio/best'
+        ydl_opts['postprocessors'] = [{
+            'key': 'FFmpegExtractAudio',  # Extract audio
+            'preferredcodec': 'mp3',
+            'preferredquality': '0',  # Best quality
+        }]
     else:
         # Video quality settings
         if quality == "best":
@@ -163,139 +313,366 @@ def download_video_internal(url, output_path, quality, format_type, audio_only,
             height = quality.replace("p", "")
             format_string = f"bestvideo[height<={height}]+bestaudio/best[height<={height}]"
         
-        cmd.extend([
-            "-f", format_string,
-            "--merge-output-format", format_type,
-        ])
+        ydl_opts['format'] = format_string
+        ydl_opts['merge_output_format'] = format_type
+        
+        # Fetch HLS/DASH fragments in parallel, and let aria2c (if installed)
+        # use several connections per file
+        ydl_opts['concurrent_fragment_downloads'] = concurrent_fragments
+        if use_aria2c and shutil.which("aria2c"):
+            ydl_opts['external_downloader'] = {'default': 'aria2c'}
+            ydl_opts['external_downloader_args'] = {'aria2c': ['-x16', '-s16', '-k1M']}
     
     # Output template - use Path for cross-platform compatibility
-    output_template = str(Path(output_path) / "%(title)s.%(ext)s")
-    cmd.extend([
-        "-o", output_template,
-        "--no-playlist",  # Don't download playlists by default
-    ])
+    ydl_opts['outtmpl'] = str(Path(output_path) / "%(title)s.%(ext)s")
     
-    cmd.append(url)
+    # Print video details from the download's own extraction instead of
+    # fetching them separately beforehand
+    ydl_opts['forceprint'] = {'before_dl': [
+        'Title: %(title|Unknown)s',
+        'Duration: %(duration_string|Unknown)s',
+        'Uploader: %(uploader|Unknown)s',
+    ]}
     
     if not is_retry:
-        safe_print(f"Downloading from: {url}")
-        if is_bilibili:
-            safe_print(f"Platform: Bilibili (with anti-412 protection)")
-        safe_print(f"Quality: {quality}")
-        safe_print(f"Format: {'mp3 (audio only)' if audio_only else format_type}")
-        safe_print(f"Output: {output_path}\n")
-        
-        # Get video info first
-        info = get_video_info(url)
-        if info:
-            safe_print(f"Title: {info.get('title', 'Unknown')}")
-            duration = info.get('duration', 0)
-            if duration:
-                try:
-                    duration_val = float(duration)
-                    minutes = int(duration_val // 60)
-                    seconds = int(duration_val % 60)
-                    safe_print(f"Duration: {minutes}:{seconds:02d}")
-                except (ValueError, TypeError):
-                    safe_print(f"Duration: {duration}")
-            safe_print(f"Uploader: {info.get('uploader', 'Unknown')}\n")
+        if len(urls) == 1:
+            print(f"Downloading from: {urls[0]}")
         else:
-            safe_print("Warning: Could not fetch video info")
-            safe_print("Attempting to download anyway...\n")
+            print(f"Downloading {len(urls)} videos:")
+            for url in urls:
+                print(f"  - {url}")
+        if is_bilibili:
+            print(f"Platform: Bilibili (with anti-412 protection)")
+        print(f"Quality: {quality}")
+        print(f"Format: {'mp3 (audio only)' if audio_only else format_type}")
+        print(f"Output: {output_path}\n")
         
-        safe_print("Starting download...")
+        print("Starting download...")
     
-    # Download the video - do NOT capture output to avoid buffer/encoding issues during progress updates
-    try:
-        # We don't use capture_output=True here so the user can see progress
-        subprocess.run(cmd, check=True)
-        return (True, None)
-    except subprocess.CalledProcessError as e:
-        return (False, f"yt-dlp failed with exit code {e.returncode}")
-    except Exception as e:
-        return (False, str(e))
+    # Download in-process; YoutubeDL prints progress straight to the console.
+    # A failed URL does not stop the rest of the batch
+    errors = []
+    retcode = 0
+    with YoutubeDL(ydl_opts) as ydl:
+        for url in urls:
+            try:
+                # Reuse fresh extracted info; yt-dlp falls back to a new
+                # extraction by itself if the cached media URLs have expired
+                # (keyed on extract_opts: YoutubeDL rewrites http_headers in ydl_opts)
+                cached = _fresh_info_cache(url, extract_opts)
+                if cached:
+                    retcode = ydl.download_with_info_file(str(cached))
+                    continue
+                
+                # Otherwise extract first and cache the result, so retrying
+                # this URL (e.g. after a 412 mid-download) skips the extractor
+                info = ydl.extract_info(url, download=False, process=False)
+                cached = _write_info_cache(url, extract_opts, ydl.sanitize_info(info))
+                if cached:
+                    retcode = ydl.download_with_info_file(str(cached))
+                else:
+                    # Playlists/feeds, or the cache could not be written
+                    ydl.process_ie_result(info, download=True)
+            except Exception as e:
+                # Keep yt-dlp's message so HTTP errors such as 412 can be recognised
+                errors.append(str(e))
+    
+    if errors:
+        return (False, "\n".join(errors))
+    if retcode:
+        return (False, f"yt-dlp failed with exit code {retcode}")
+    return (True, None)
 
 
-def download_video(url, output_path=None, quality="best", format_type="mp4", audio_only=False):
+def default_output_path():
+    """Smart default output path detection, relative to the current directory."""
+    cwd = Path.cwd()
+    
+    # Try to detect if we are inside a .claude directory structure
+    claude_base = None
+    for parent in [cwd] + list(cwd.parents):
+        if parent.name == ".claude":
+            claude_base = parent.parent
+            break
+    
+    if claude_base:
+        # If we found a .claude directory, we use its parent as the base
+        # Prefer 'Downloads' folder if it exists in the base directory
+        downloads_dir = claude_base
+        if downloads_dir.exists() and downloads_dir.is_dir():
+            return str(downloads_dir)
+        return str(claude_base)
+    
+    # If no .claude found, use the current working directory
+    return str(cwd)
+
+
+def download_video(url, output_path=None, quality="best", format_type="mp4", audio_only=False,
+                   concurrent_fragments=4, use_aria2c=True):
     """
     Download a video from YouTube, Bilibili or other platforms.
     
     Args:
-        url: Video URL
+        url: Video URL, or a list of URLs to download in a single yt-dlp run
         output_path: Directory to save the video (default: smart detection)
         quality: Quality setting (best, 1080p, 720p, 480p, 360p, worst)
         format_type: Output format (mp4, webm, mkv, etc.)
         audio_only: Download only audio (mp3)
+        concurrent_fragments: Number of fragments to download in parallel (video only)
+        use_aria2c: Let aria2c download the files when it is installed
     """
     check_yt_dlp()
     
-    # Smart default output path detection
     if output_path is None:
-        cwd = Path.cwd()
-        
-        # Try to detect if we are inside a .claude directory structure
-        claude_base = None
-        for parent in [cwd] + list(cwd.parents):
-            if parent.name == ".claude":
-                claude_base = parent.parent
-                break
-        
-        if claude_base:
-            # If we found a .claude directory, we use its parent as the base
-            # Prefer 'Downloads' folder if it exists in the base directory
-            downloads_dir = claude_base
-            if downloads_dir.exists() and downloads_dir.is_dir():
-                output_path = str(downloads_dir)
-            else:
-                output_path = str(claude_base)
-        else:
-            # If no .claude found, use the current working directory
-            output_path = str(cwd)
+        output_path = default_output_path()
     
     # Ensure output directory exists and use absolute path
-    output_path = os.path.abspath(output_path)
-    os.makedirs(output_path, exist_ok=True)
+    output_path = Path(output_path).resolve()
+    output_path.mkdir(parents=True, exist_ok=True)
     
-    is_bilibili = is_bilibili_url(url)
+    urls = [url] if isinstance(url, str) else list(url)
+    
+    bilibili_flags = [is_bilibili_url(u) for u in urls]
+    is_bilibili = any(bilibili_flags)
     
     if is_bilibili:
-        url = format_bilibili_url(url)
+        urls = [format_bilibili_url(u, is_bilibili=flag) for u, flag in zip(urls, bilibili_flags)]
 
     try:
         # Attempt download
         success, error_msg = download_video_internal(
-            url, output_path, quality, format_type, audio_only, is_retry=False
+            urls, output_path, quality, format_type, audio_only, is_retry=False,
+            concurrent_fragments=concurrent_fragments, is_bilibili=is_bilibili,
+            use_aria2c=use_aria2c
         )
         
         if success:
-            safe_print("\n[SUCCESS] Download complete!")
-            safe_print(f"Saved to: {output_path}")
+            print("\n[SUCCESS] Download complete!")
+            print(f"Saved to: {output_path}")
             return True
         
         # If still failed, show error message
-        safe_print("\n[ERROR] Error downloading video:")
+        print("\n[ERROR] Error downloading video:")
         if error_msg:
-            safe_print(error_msg)
+            print(error_msg)
         
         # Provide helpful hints for common errors
         if is_bilibili and error_msg:
             if "412" in error_msg:
-                safe_print("\n[HINT] Bilibili 412 error. Try waiting a few minutes or using a different IP.")
+                print("\n[HINT] Bilibili 412 error. Try waiting a few minutes or using a different IP.")
             elif "403" in error_msg or "forbidden" in error_msg.lower():
-                safe_print("\n[HINT] Access forbidden. The video might be restricted or login required.")
+                print("\n[HINT] Access forbidden. The video might be restricted or login required.")
         
         return False
             
     except Exception as e:
-        safe_print(f"\n[ERROR] Error: {e}")
+        print(f"\n[ERROR] Error: {e}")
+        return False
+
+
+def _host_key(url):
+    """Group URLs by site so each one gets its own concurrency limit."""
+    if is_bilibili_url(url):
+        return "bilibili"
+    try:
+        return urlparse(url).netloc.lower()
+    except Exception:
+        return ""
+
+
+async def download_many(urls, concurrency=4, per_host=2, **kwargs):
+    """
+    Download several videos concurrently.
+    
+    Each URL is passed to download_video in a worker thread, since yt-dlp
+    is blocking. At most `concurrency` downloads run at once, and at most
+    `per_host` against the same site to avoid triggering rate limits
+    (e.g. Bilibili's 412).
+    
+    Returns a list with the success flag of each URL, in order.
+    """
+    import asyncio
+    from collections import defaultdict
+    
+    # Install yt-dlp up front rather than racing to do it in every worker
+    check_yt_dlp()
+    
+    limit = asyncio.Semaphore(concurrency)
+    host_limits = defaultdict(lambda: asyncio.Semaphore(per_host))
+    
+    async def run(url):
+        async with host_limits[_host_key(url)], limit:
+            return await asyncio.to_thread(download_video, url, **kwargs)
+    
+    return await asyncio.gather(*(run(url) for url in urls))
+
+
+def run_downloads(urls, jobs=4, **kwargs):
+    """
+    Download the given URLs, concurrently if there are several and jobs > 1.
+    Returns True if every download succeeded.
+    """
+    if len(urls) > 1 and jobs > 1:
+        import asyncio
+        results = asyncio.run(download_many(urls, concurrency=jobs, **kwargs))
+        
+        # The downloads' own output is interleaved and does not name the URL,
+        # so finish with which ones succeeded
+        print(f"\n[SUMMARY] {sum(results)}/{len(results)} downloads succeeded")
+        for url, success in zip(urls, results):
+            print(f"  {'[OK]' if success else '[FAILED]'} {url}")
+        return all(results)
+    return download_video(url=urls, **kwargs)
+
+
+def run_daemon(socket_path=DAEMON_SOCKET):
+    """
+    Serve download requests from --client over a Unix socket.
+    
+    yt-dlp and its real extractor modules (not just the lazy stubs) are
+    imported once up front. Each connection is handled in a forked child
+    that inherits them, so requests skip the import cost and run isolated
+    from each other. A request is one JSON line
+    {"urls": [...], "jobs": n, "options": {...}} (options are download_video
+    keyword arguments); the reply is a stream of {"output": text} lines
+    followed by {"success": bool}.
+    """
+    import contextlib
+    import io
+    import socket
+    import socketserver
+    import stat
+    
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "fork"):
+        print("[ERROR] Daemon mode needs Unix sockets and fork(), which this platform does not provide.")
+        return False
+    
+    socket_path = Path(socket_path)
+    
+    # Refuse to replace anything but a stale socket, and never steal the
+    # socket of a daemon that is still running
+    if socket_path.exists():
+        if not stat.S_ISSOCK(socket_path.stat().st_mode):
+            print(f"[ERROR] {socket_path} exists and is not a socket")
+            return False
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(socket_path))
+                print(f"[ERROR] A daemon is already listening on {socket_path}")
+                return False
+            except OSError:
+                socket_path.unlink()
+    
+    check_yt_dlp()
+    # gen_extractor_classes() alone only loads yt-dlp's lazy extractor stubs;
+    # the modules behind them are what a download would otherwise import
+    import yt_dlp.extractor._extractors  # noqa: F401
+    from yt_dlp.extractor import gen_extractor_classes
+    gen_extractor_classes()
+    
+    class SocketWriter(io.TextIOBase):
+        """Text stream that forwards everything written to the client."""
+        
+        def __init__(self, wfile):
+            self.wfile = wfile
+        
+        def writable(self):
+            return True
+        
+        def write(self, text):
+            self.wfile.write(_json_dumps({'output': text}) + b'\n')
+            return len(text)
+        
+        def flush(self):
+            self.wfile.flush()
+    
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            stream = SocketWriter(self.wfile)
+            # Safe to redirect process-wide: this runs in a forked child
+            with contextlib.redirect_stdout(stream), contextlib.redirect_stderr(stream):
+                success = False
+                try:
+                    request = _json_loads(self.rfile.readline())
+                    urls = request['urls']
+                    jobs = request.get('jobs', 4)
+                    options = request.get('options', {})
+                    if not isinstance(urls, list) or not urls or not isinstance(options, dict):
+                        raise ValueError("expected a non-empty 'urls' list and an 'options' object")
+                    # aria2c writes to the daemon's own terminal, which the
+                    # redirect cannot reach, so let yt-dlp download natively
+                    options['use_aria2c'] = False
+                except Exception as e:
+                    print(f"[ERROR] Invalid request: {e!r}")
+                else:
+                    try:
+                        success = run_downloads(urls, jobs=jobs, **options)
+                    except Exception as e:
+                        print(f"\n[ERROR] Error: {e}")
+            self.wfile.write(_json_dumps({'success': success}) + b'\n')
+    
+    class Server(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+        pass
+    
+    # Anyone who can connect can make the daemon download files, so keep the
+    # socket private to this user (bound under a restrictive umask, there is
+    # no window where it is more widely accessible)
+    socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    old_umask = os.umask(0o077)
+    try:
+        server = Server(str(socket_path), Handler)
+    finally:
+        os.umask(old_umask)
+    
+    with server:
+        print(f"Daemon listening on {socket_path} (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+    return True
+
+
+def run_client(urls, socket_path=DAEMON_SOCKET, jobs=4, **kwargs):
+    """
+    Hand the download over to a running daemon and relay its output.
+    Returns True if every download succeeded.
+    """
+    import socket
+    
+    # The daemon has its own working directory, so send an absolute path
+    output_path = kwargs.get('output_path') or default_output_path()
+    kwargs['output_path'] = str(Path(output_path).resolve())
+    
+    request = {'urls': urls, 'jobs': jobs, 'options': kwargs}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            sock.sendall(_json_dumps(request) + b'\n')
+            with sock.makefile('rb') as replies:
+                for line in replies:
+                    reply = _json_loads(line)
+                    if 'output' in reply:
+                        sys.stdout.write(reply['output'])
+                        sys.stdout.flush()
+                    else:
+                        return bool(reply.get('success'))
+    except OSError as e:
+        print(f"[ERROR] Could not reach the daemon at {socket_path}: {e}")
+        print("[HINT] Start it with: video_download.py --daemon")
         return False
+    
+    print("[ERROR] The daemon closed the connection before the download finished.")
+    return False
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Download videos from YouTube, Bilibili and other platforms with customizable quality and format"
     )
-    parser.add_argument("url", help="Video URL")
+    parser.add_argument("urls", nargs="*", metavar="url", help="Video URL(s)")
     parser.add_argument(
         "-o", "--output",
         default=None,
@@ -318,17 +695,55 @@ def main():
         action="store_true",
         help="Download only audio as MP3"
     )
+    parser.add_argument(
+        "-N", "--concurrent-fragments",
+        type=int,
+        default=4,
+        help="Number of fragments of a video to download in parallel (default: 4)"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=4,
+        help="Number of videos to download concurrently when several URLs are given (default: 4)"
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run as a daemon that keeps yt-dlp loaded and serves --client requests"
+    )
+    parser.add_argument(
+        "--client",
+        action="store_true",
+        help="Send the download to a running daemon instead of downloading in this process"
+    )
+    parser.add_argument(
+        "--socket",
+        default=str(DAEMON_SOCKET),
+        help="Unix socket used by --daemon and --client (default: %(default)s)"
+    )
     
     args = parser.parse_args()
     
-    success = download_video(
-        url=args.url,
+    if args.daemon:
+        sys.exit(0 if run_daemon(args.socket) else 1)
+    
+    if not args.urls:
+        parser.error("the following arguments are required: url")
+    
+    options = dict(
         output_path=args.output,
         quality=args.quality,
         format_type=args.format,
-        audio_only=args.audio_only
+        audio_only=args.audio_only,
+        concurrent_fragments=args.concurrent_fragments
     )
     
+    if args.client:
+        success = run_client(args.urls, socket_path=args.socket, jobs=args.jobs, **options)
+    else:
+        success = run_downloads(args.urls, jobs=args.jobs, **options)
+    
     sys.exit(0 if success else 1)
 
 